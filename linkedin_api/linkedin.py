@@ -15,7 +15,6 @@ from urllib.parse import quote, urlencode
 from linkedin_api import model
 from linkedin_api.client import Client, UserNotFoundException
 from linkedin_api.utils.helpers import (
-    append_update_post_field_to_posts_list,
     get_id_from_urn,
     get_list_posts_sorted_without_promoted,
     get_update_author_name,
@@ -1493,7 +1492,9 @@ class Linkedin(object):
                     self.logger.exception(e)
                     pass
 
-        res = elements_to_linkedin_activity(data["elements"])
+        res = model.LinkedinProfileActivityData(
+            activities=list(elements_to_linkedin_activity(data["elements"])),
+        )
         return res
     
 
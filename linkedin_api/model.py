@@ -1,8 +1,31 @@
-from datetime import datetime
-from typing import List
-from pydantic import BaseModel
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Optional
+
+
+@dataclass
+class LinkedinActivity:
+    # declared by hand, dataclass(slots=True) needs python 3.10
+    __slots__ = (
+        "actor_urn",
+        "actor_type",
+        "actor_name",
+        "dash_entity_urn",
+        "entity_urn",
+        "url",
+        "caption",
+        "post_urn",
+        "is_shared",
+        "shared_caption",
+        "shared_url",
+        "is_reposted",
+        "is_liked",
+        "is_commented",
+        "comment",
+        "comment_timestamp",
+        "timestamp_ms",
+    )
 
-class LinkedinActivity(BaseModel):
     actor_urn: str
     actor_type: str
     actor_name: str
@@ -18,8 +41,16 @@ class LinkedinActivity(BaseModel):
     is_liked: bool
     is_commented: bool
     comment: str
-    comment_timestamp: datetime
-    timestamp: datetime
-    
-class LinkedinProfileActivityData(BaseModel):
-    activities: List[LinkedinActivity]
\ No newline at end of file
+    comment_timestamp: Optional[datetime]
+    timestamp_ms: int
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.timestamp_ms / 1000, tz=timezone.utc)
+
+
+@dataclass
+class LinkedinProfileActivityData:
+    __slots__ = ("activities",)
+
+    activities: List[LinkedinActivity]
@@ -1,10 +1,15 @@
 import datetime
+import functools
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 from linkedin_api import model
 import random
 import base64
 
+_ACTIVITY_URN_RE = re.compile(r"urn:li:activity:(\d+)")
+_UTC = datetime.timezone.utc
+_FROMTS = datetime.datetime.fromtimestamp
+
 
 def get_id_from_urn(urn):
     """
@@ -12,7 +17,7 @@ def get_id_from_urn(urn):
 
     Example: urn:li:fs_miniProfile:<id>
     """
-    return urn.split(":")[3]
+    return urn.split(":", 4)[3]
 
 
 def get_urn_from_raw_update(raw_string):
@@ -22,7 +27,33 @@ def get_urn_from_raw_update(raw_string):
     Example: urn:li:fs_miniProfile:<id>
     Example: urn:li:fs_updateV2:(<urn>,GROUP_FEED,EMPTY,DEFAULT,false)
     """
-    return raw_string.split("(")[1].split(",")[0]
+    _, sep, raw_urns = raw_string.partition("(")
+    if not sep:
+        raise ValueError(f"No URN found in raw update {raw_string!r}")
+    urn, _, _ = raw_urns.partition(",")
+    return urn
+
+
+def get_actor_type_from_urn(urn):
+    """
+    Return the actor type ('company' or 'member') of a given Linkedin URN,
+    based on its entity type segment. Empty string if it is neither.
+
+    Example: urn:li:company:<id>
+    Example: urn:li:member:<id>
+    """
+    return _get_actor_type_from_urn_head(urn.rpartition(":")[0])
+
+
+def _get_actor_type_from_urn_head(urn_head):
+    """Same as get_actor_type_from_urn, for a URN with its id already
+    stripped. Example: urn:li:company"""
+    entity_type = urn_head.rpartition(":")[2].lower()
+    if "company" in entity_type:
+        return "company"
+    elif "member" in entity_type:
+        return "member"
+    return ""
 
 
 def get_update_author_name(d_included):
@@ -104,10 +135,11 @@ def get_update_author_profile(d_included, base_url):
     except TypeError:
         return "None"
     else:
-        urn_id = urn.split(":")[-1]
-        if "company" in urn:
+        urn_head, _, urn_id = urn.rpartition(":")
+        actor_type = _get_actor_type_from_urn_head(urn_head)
+        if actor_type == "company":
             return f"{base_url}/company/{urn_id}"
-        elif "member" in urn:
+        elif actor_type == "member":
             return f"{base_url}/in/{urn_id}"
 
 
@@ -132,34 +164,6 @@ def get_update_url(d_included, base_url):
         return f"{base_url}/feed/update/{urn}"
 
 
-def append_update_post_field_to_posts_list(d_included, l_posts, post_key, post_value):
-    """Parse a dict and returns, if present, the desired value. Finally it
-    updates an already existing dict in the list or add a new dict to it
-
-    :param d_included: a dict, as returned by res.json().get("included", {})
-    :type d_raw: dict
-    :param l_posts: a list with dicts
-    :type l_posts: list
-    :param post_key: the post field name to extract. Example: 'author_name'
-    :type post_key: str
-    :param post_value: the post value correspoding to post_key
-    :type post_value: str
-
-    :return: post list
-    :rtype: list
-    """
-    elements_current_index = len(l_posts) - 1
-
-    if elements_current_index == -1:
-        l_posts.append({post_key: post_value})
-    else:
-        if not post_key in l_posts[elements_current_index]:
-            l_posts[elements_current_index][post_key] = post_value
-        else:
-            l_posts.append({post_key: post_value})
-    return l_posts
-
-
 def parse_list_raw_urns(l_raw_urns):
     """Iterates a list containing posts URNS and retrieves list of URNs
 
@@ -175,7 +179,9 @@ def parse_list_raw_urns(l_raw_urns):
     return l_urns
 
 
-def parse_list_raw_posts(l_raw_posts, linkedin_base_url):
+def parse_list_raw_posts(
+    l_raw_posts: Iterable[Any], linkedin_base_url: str
+) -> List[Dict[str, Any]]:
     """Iterates a unsorted list containing post fields and assemble a
     list of dicts, each one of them contains a post
 
@@ -187,40 +193,41 @@ def parse_list_raw_posts(l_raw_posts, linkedin_base_url):
     :return: List of dicts, each one of them is a post
     :rtype: list
     """
-    l_posts = []
+    l_posts: List[Dict[str, Any]] = []
     for i in l_raw_posts:
+        post: Dict[str, Any] = {}
+
         author_name = get_update_author_name(i)
         if author_name:
-            l_posts = append_update_post_field_to_posts_list(
-                i, l_posts, "author_name", author_name
-            )
+            post["author_name"] = author_name
 
         author_profile = get_update_author_profile(i, linkedin_base_url)
         if author_profile:
-            l_posts = append_update_post_field_to_posts_list(
-                i, l_posts, "author_profile", author_profile
-            )
+            post["author_profile"] = author_profile
 
         old = get_update_old(i)
         if old:
-            l_posts = append_update_post_field_to_posts_list(i, l_posts, "old", old)
+            post["old"] = old
 
         content = get_update_content(i, linkedin_base_url)
         if content:
-            l_posts = append_update_post_field_to_posts_list(
-                i, l_posts, "content", content
-            )
+            post["content"] = content
 
         url = get_update_url(i, linkedin_base_url)
         if url:
-            l_posts = append_update_post_field_to_posts_list(i, l_posts, "url", url)
+            post["url"] = url
+
+        if post:
+            l_posts.append(post)
 
     return l_posts
 
 
-def get_list_posts_sorted_without_promoted(l_urns, l_posts):
+def get_list_posts_sorted_without_promoted(
+    l_urns: Iterable[str], l_posts: Iterable[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
     """Iterates l_urns and looks for corresponding dicts in l_posts matching 'url' key.
-    If found, removes this dict from l_posts and appends it to the returned list of posts
+    If found, appends it to the returned list of posts. Each post is returned at most once
 
     :param l_urns: List of posts URNs
     :type l_urns: list
@@ -230,83 +237,104 @@ def get_list_posts_sorted_without_promoted(l_urns, l_posts):
     :return: List of dicts, each one of them is a post
     :rtype: list
     """
-    l_posts_sorted_without_promoted = []
-    l_posts[:] = [d for d in l_posts if "Promoted" not in d.get("old")]
+    l_posts = [
+        d for d in l_posts if (old := d.get("old")) is None or "Promoted" not in old
+    ]
+    # index posts by the URN at the end of their url, keeping the first one seen
+    d_posts_by_urn: Dict[str, Dict[str, Any]] = {}
+    for post in l_posts:
+        d_posts_by_urn.setdefault(post.get("url", "").rpartition("/")[2], post)
+
+    l_posts_sorted_without_promoted: List[Dict[str, Any]] = []
     for urn in l_urns:
-        for post in l_posts:
-            if urn in post["url"]:
-                l_posts_sorted_without_promoted.append(post)
-                l_posts[:] = [d for d in l_posts if urn not in d.get("url")]
-                break
+        if urn in d_posts_by_urn:
+            l_posts_sorted_without_promoted.append(d_posts_by_urn.pop(urn))
     return l_posts_sorted_without_promoted
 
-def get_timestamp_from_entity_urn(entity_urn: str) -> datetime.datetime:
-    urn_activity = re.search("(urn:li:activity:\d+)", entity_urn).group()
-    post_id = urn_activity.split(":")[-1]
-    post_id_binary = bin(int(post_id))
-    first_41 = post_id_binary[:43]
-    raw_timestamp = int(first_41, 2) / 1000
 
-    timestamp = datetime.datetime.fromtimestamp(raw_timestamp, tz=datetime.timezone.utc)
+def _dig(d: Any, *keys: str, default: Any = "", expected: Any = str) -> Any:
+    """Walks nested dicts following keys and returns the value found,
+    or default if a key is missing, it meets a non-dict on the way or the
+    value isn't an instance of expected"""
+    for key in keys:
+        if not isinstance(d, dict):
+            return default
+        d = d.get(key)
+    return d if isinstance(d, expected) else default
+
+
+@functools.lru_cache(maxsize=8192)
+def get_timestamp_ms_from_entity_urn(entity_urn: str) -> int:
+    """Returns the creation time of an activity, in milliseconds since the epoch
+
+    :param entity_urn: URN containing an activity URN. Example: urn:li:activity:<id>
+    :type entity_urn: str
+
+    :return: Milliseconds since the epoch
+    :rtype: int
+    """
+    match = _ACTIVITY_URN_RE.search(entity_urn)
+    if match is None:
+        raise ValueError(f"No activity URN found in {entity_urn!r}")
+    # the first 41 bits of the (63 bit) activity id are the epoch in milliseconds
+    return int(match.group(1)) >> 22
+
+
+def get_timestamp_from_entity_urn(entity_urn: str) -> datetime.datetime:
+    timestamp = _FROMTS(get_timestamp_ms_from_entity_urn(entity_urn) / 1000, _UTC)
     return timestamp
 
-def elements_to_linkedin_activity(data: List[Dict[Any, Any]]) -> model.LinkedinProfileActivityData:
-    activities_list: List[model.LinkedinActivity] = []
-    for d in data:
-        is_liked = is_reposted = is_shared = is_commented = False
 
-        actor_type = ""
-        url = ""
-        shared_url = ""
-        try:
-            actor_urn: str = d["actor"]["urn"]
+def clear_timestamp_cache() -> None:
+    """Clears the cache of get_timestamp_ms_from_entity_urn. Useful for long running processes"""
+    get_timestamp_ms_from_entity_urn.cache_clear()
 
-            if "company" in actor_urn:
-                actor_type = "company"
-            elif "member" in actor_urn:
-                actor_type = "member"
-        except:
-            actor_urn = ""
 
-        try:
-            actor_name: str = d["actor"]["name"]["text"]
-        except:
-            actor_name = ""
-    
-        try:
-            dash_entity_urn: str = d["dashEntityUrn"]
-        except:
-            dash_entity_urn = ""
+def elements_to_linkedin_activity(
+    data: Iterable[Any],
+) -> Iterator[model.LinkedinActivity]:
+    for d in data:
+        is_liked = is_reposted = is_shared = is_commented = False
 
-        try:
-            entity_urn: str = d["entityUrn"]
-        except:
-            entity_urn = ""
+        actor_urn: str = _dig(d, "actor", "urn")
+        actor_type = get_actor_type_from_urn(actor_urn) if actor_urn else ""
 
-        try:
-            actions = d["updateMetadata"]["updateActions"]["actions"]
-            for a in actions:
-                if a["actionType"] == "SHARE_VIA":
-                    url: str = a["url"]
-                    break
-        except:
-            url = ""
+        actor_name: str = _dig(d, "actor", "name", "text")
+        dash_entity_urn: str = _dig(d, "dashEntityUrn")
+        entity_urn: str = _dig(d, "entityUrn")
 
-        try:
-            shared_caption: str = d["resharedUpdate"]["commentary"]["text"]["text"]
-            shared_actions = d["resharedUpdate"]["updateMetadata"]["updateActions"]["actions"]
+        url: str = ""
+        for a in _dig(
+            d, "updateMetadata", "updateActions", "actions", default=(), expected=list
+        ):
+            if _dig(a, "actionType") == "SHARE_VIA":
+                url = _dig(a, "url")
+                break
+
+        shared_caption = _dig(
+            d, "resharedUpdate", "commentary", "text", "text", default=None
+        )
+        shared_actions = _dig(
+            d,
+            "resharedUpdate",
+            "updateMetadata",
+            "updateActions",
+            "actions",
+            default=None,
+            expected=list,
+        )
+        shared_url: str = ""
+        if shared_caption is not None and shared_actions is not None:
             for a in shared_actions:
-                if a["actionType"] == "SHARE_VIA":
-                    shared_url: str = a["url"]
+                if _dig(a, "actionType") == "SHARE_VIA":
+                    shared_url = _dig(a, "url")
                     break
             is_shared = True
-        except:
+        else:
             shared_caption = ""
-            shared_url = ""
 
- 
-        try:
-            header_text: str = d["header"]["text"]["text"]
+        header_text = _dig(d, "header", "text", "text", default=None)
+        if header_text is not None:
             if is_shared and header_text:
                 is_shared = False
             if not is_shared:
@@ -317,56 +345,54 @@ def elements_to_linkedin_activity(data: List[Dict[Any, Any]]) -> model.LinkedinP
                 else:
                     # too many branches
                     is_liked = True
-        except:
-            pass
 
-        highlighted_comment = ""
-        highlighted_comment_datetime: datetime.datetime = datetime.datetime.now(tz=datetime.timezone.utc)
+        highlighted_comment: str = ""
+        highlighted_comment_datetime: Optional[datetime.datetime] = None
         if is_commented:
-            try:
-                highlighted_comment_data = d["highlightedComments"][0]
-                highlighted_comment: str = highlighted_comment_data["commentV2"]["text"]
-                highlighted_comment_timestamp: int = highlighted_comment_data["createdTime"]
-                highlighted_comment_datetime: datetime.datetime = datetime.datetime.fromtimestamp(highlighted_comment_timestamp/1000, tz=datetime.timezone.utc)
-            except:
-                pass
-
-        try:
-            caption: str = d["commentary"]["text"]["text"]
-        except:
-            caption = ""
+            highlighted_comments = _dig(
+                d, "highlightedComments", default=(), expected=list
+            )
+            if highlighted_comments:
+                highlighted_comment_data = highlighted_comments[0]
+                highlighted_comment = _dig(
+                    highlighted_comment_data, "commentV2", "text"
+                )
+                highlighted_comment_timestamp = _dig(
+                    highlighted_comment_data,
+                    "createdTime",
+                    default=None,
+                    expected=(int, float),
+                )
+                if highlighted_comment_timestamp is not None:
+                    highlighted_comment_datetime = _FROMTS(
+                        highlighted_comment_timestamp / 1000, _UTC
+                    )
+
+        caption: str = _dig(d, "commentary", "text", "text")
+        post_urn: str = _dig(d, "updateMetadata", "urn")
 
-        try:
-            post_urn: str = d["updateMetadata"]["urn"]
-        except:
-            post_urn = ""
-                
         activity_data = model.LinkedinActivity(
-            actor_urn= actor_urn,
-            actor_type= actor_type,
-            actor_name= actor_name,
-            dash_entity_urn= dash_entity_urn,
-            entity_urn= entity_urn,
-            url= url,
-            caption= caption,
-            post_urn= post_urn,
-            is_shared= is_shared,
-            shared_caption= shared_caption,
+            actor_urn=actor_urn,
+            actor_type=actor_type,
+            actor_name=actor_name,
+            dash_entity_urn=dash_entity_urn,
+            entity_urn=entity_urn,
+            url=url,
+            caption=caption,
+            post_urn=post_urn,
+            is_shared=is_shared,
+            shared_caption=shared_caption,
             shared_url=shared_url,
-            is_reposted= is_reposted,
-            is_liked= is_liked,
-            is_commented= is_commented,
-            comment = highlighted_comment,
-            comment_timestamp = highlighted_comment_datetime,
-            timestamp = get_timestamp_from_entity_urn(entity_urn),
+            is_reposted=is_reposted,
+            is_liked=is_liked,
+            is_commented=is_commented,
+            comment=highlighted_comment,
+            comment_timestamp=highlighted_comment_datetime,
+            timestamp_ms=get_timestamp_ms_from_entity_urn(entity_urn),
         )
 
-        activities_list.append(activity_data)
+        yield activity_data
 
-    return model.LinkedinProfileActivityData(
-        activities=activities_list,
-    )
-        
 
 def generate_trackingId_as_charString():
     """Generates and returns a random trackingId
@@ -1,10 +1,27 @@
 import setuptools
 import ast
+import os
 import re
+import sys
 from pathlib import Path
 
 CURRENT_DIR = Path(__file__).parent
 
+USE_MYPYC = False
+# Compile the helpers with mypyc; the pure Python module is used when it isn't built
+if len(sys.argv) > 1 and sys.argv[1] == "--use-mypyc":
+    sys.argv.pop(1)
+    USE_MYPYC = True
+if os.getenv("LINKEDIN_API_USE_MYPYC", None) == "1":
+    USE_MYPYC = True
+
+if USE_MYPYC:
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["--follow-imports=silent", "linkedin_api/utils/helpers.py"])
+else:
+    ext_modules = []
+
 
 def get_long_description() -> str:
     readme_md = CURRENT_DIR / "README.md"
@@ -32,6 +49,7 @@ setuptools.setup(
     url="https://github.com/tomquirk/linkedin-api",
     license="MIT",
     packages=setuptools.find_packages(),
+    ext_modules=ext_modules,
     install_requires=["requests", "beautifulsoup4", "lxml"],
     classifiers=(
         "Programming Language :: Python :: 3",
@@ -1,10 +1,307 @@
 import os
 import sys
 import pytest
+from datetime import datetime, timezone
 
 from linkedin_api import Linkedin
+from linkedin_api.utils.helpers import (
+    elements_to_linkedin_activity,
+    get_actor_type_from_urn,
+    get_list_posts_sorted_without_promoted,
+    get_timestamp_from_entity_urn,
+    get_timestamp_ms_from_entity_urn,
+    get_update_author_profile,
+    get_update_content,
+    get_urn_from_raw_update,
+    parse_list_raw_posts,
+)
+
+BASE_URL = "https://www.linkedin.com"
+ENTITY_URN = "urn:li:activity:7118293384746524672"
+ENTITY_TIMESTAMP_MS = 1697133394419
+
+
+def _post(urn, old="1 d"):
+    return {"old": old, "url": f"{BASE_URL}/feed/update/{urn}"}
 
 
 def test_constructor():
     api = Linkedin("test", "test", authenticate=False)
     assert api
+
+
+def test_get_list_posts_sorted_without_promoted():
+    post_1 = _post("urn:li:activity:1")
+    post_2 = _post("urn:li:activity:2")
+    promoted = _post("urn:li:activity:3", old="Promoted")
+    l_urns = ["urn:li:activity:2", "urn:li:activity:3", "urn:li:activity:1"]
+
+    posts = get_list_posts_sorted_without_promoted(l_urns, [post_1, promoted, post_2])
+
+    assert posts == [post_2, post_1]
+
+
+def test_get_list_posts_sorted_without_promoted_missing_fields():
+    no_old = {"url": f"{BASE_URL}/feed/update/urn:li:activity:1"}
+    none_old = {"old": None, "url": f"{BASE_URL}/feed/update/urn:li:activity:2"}
+    no_url = {"old": "1 d"}
+    l_urns = ["urn:li:activity:1", "urn:li:activity:2"]
+
+    posts = get_list_posts_sorted_without_promoted(l_urns, [no_url, none_old, no_old])
+
+    assert posts == [no_old, none_old]
+
+
+def test_get_list_posts_sorted_without_promoted_duplicates():
+    first = _post("urn:li:activity:1")
+    duplicate = _post("urn:li:activity:1", old="2 d")
+    l_urns = ["urn:li:activity:1", "urn:li:activity:1"]
+
+    posts = get_list_posts_sorted_without_promoted(l_urns, [first, duplicate])
+
+    assert posts == [first]
+
+
+def test_get_list_posts_sorted_without_promoted_exact_urn():
+    post_123 = _post("urn:li:activity:123")
+
+    # urn:li:activity:12 is a prefix of post_123's URN, but not the same post
+    posts_12 = get_list_posts_sorted_without_promoted(
+        ["urn:li:activity:12"], [post_123]
+    )
+    posts_123 = get_list_posts_sorted_without_promoted(
+        ["urn:li:activity:123"], [post_123]
+    )
+
+    assert posts_12 == []
+    assert posts_123 == [post_123]
+
+
+@pytest.mark.parametrize(
+    "urn,actor_type",
+    [
+        ("urn:li:member:123", "member"),
+        ("urn:li:company:123", "company"),
+        ("urn:li:fs_miniCompany:123", "company"),
+        ("urn:li:fsd_profile:ACoAAA", ""),
+    ],
+)
+def test_get_actor_type_from_urn(urn, actor_type):
+    assert get_actor_type_from_urn(urn) == actor_type
+
+
+def test_get_update_author_profile():
+    def author_profile(urn):
+        return get_update_author_profile({"actor": {"urn": urn}}, BASE_URL)
+
+    assert author_profile("urn:li:member:123") == f"{BASE_URL}/in/123"
+    assert author_profile("urn:li:company:123") == f"{BASE_URL}/company/123"
+    assert author_profile("urn:li:fs_miniCompany:123") == f"{BASE_URL}/company/123"
+    assert author_profile("urn:li:fsd_profile:ACoAAA") is None
+
+
+def test_get_timestamp_ms_from_entity_urn():
+    activity_id = 7118293384746524672
+    entity_urn = f"urn:li:fs_updateV2:(urn:li:activity:{activity_id},MEMBER_SHARES)"
+
+    timestamp_ms = get_timestamp_ms_from_entity_urn(entity_urn)
+
+    # the first 41 bits of the id, as previously decoded from its binary string
+    assert timestamp_ms == int(bin(activity_id)[:43], 2) == 1697133394419
+    assert get_timestamp_from_entity_urn(entity_urn) == datetime.fromtimestamp(
+        1697133394.419, tz=timezone.utc
+    )
+
+
+def _share_via(url):
+    return {"updateActions": {"actions": [{"actionType": "SHARE_VIA", "url": url}]}}
+
+
+def _element(header_text=None, **fields):
+    element = {
+        "actor": {"urn": "urn:li:member:123", "name": {"text": "Jane"}},
+        "entityUrn": ENTITY_URN,
+        "dashEntityUrn": "urn:li:fsd_update:1",
+        "commentary": {"text": {"text": "caption"}},
+        "updateMetadata": {"urn": ENTITY_URN, **_share_via("https://lnkd.in/post")},
+    }
+    if header_text is not None:
+        element["header"] = {"text": {"text": header_text}}
+    element.update(fields)
+    return element
+
+
+def _activity(element):
+    (activity,) = elements_to_linkedin_activity([element])
+    return activity
+
+
+def test_elements_to_linkedin_activity_liked():
+    activity = _activity(_element("Jane likes this"))
+
+    assert activity.is_liked
+    assert not (activity.is_reposted or activity.is_commented or activity.is_shared)
+    assert activity.actor_urn == "urn:li:member:123"
+    assert activity.actor_type == "member"
+    assert activity.actor_name == "Jane"
+    assert activity.dash_entity_urn == "urn:li:fsd_update:1"
+    assert activity.entity_urn == ENTITY_URN
+    assert activity.post_urn == ENTITY_URN
+    assert activity.caption == "caption"
+    assert activity.url == "https://lnkd.in/post"
+    assert activity.comment == ""
+    assert activity.comment_timestamp is None
+    assert activity.timestamp_ms == ENTITY_TIMESTAMP_MS
+    assert activity.timestamp == datetime.fromtimestamp(
+        ENTITY_TIMESTAMP_MS / 1000, tz=timezone.utc
+    )
+
+
+def test_elements_to_linkedin_activity_reposted():
+    activity = _activity(_element("Jane reposted this"))
+
+    assert activity.is_reposted
+    assert not (activity.is_liked or activity.is_commented or activity.is_shared)
+    assert activity.comment_timestamp is None
+
+
+def test_elements_to_linkedin_activity_commented():
+    comment = {"commentV2": {"text": "Nice!"}, "createdTime": 1697000000000}
+    element = _element("Jane commented on this", highlightedComments=[comment])
+
+    activity = _activity(element)
+
+    assert activity.is_commented
+    assert not (activity.is_liked or activity.is_reposted or activity.is_shared)
+    assert activity.comment == "Nice!"
+    assert activity.comment_timestamp == datetime.fromtimestamp(
+        1697000000, tz=timezone.utc
+    )
+
+
+def test_elements_to_linkedin_activity_commented_without_text():
+    comment = {"commentV2": {"text": ""}, "createdTime": 1697000000000}
+    element = _element("Jane commented on this", highlightedComments=[comment])
+
+    activity = _activity(element)
+
+    assert activity.is_commented
+    assert activity.comment == ""
+    assert activity.comment_timestamp == datetime.fromtimestamp(
+        1697000000, tz=timezone.utc
+    )
+
+
+def test_elements_to_linkedin_activity_shared():
+    reshared_update = {
+        "commentary": {"text": {"text": "shared caption"}},
+        "updateMetadata": _share_via("https://lnkd.in/shared"),
+    }
+
+    activity = _activity(_element(resharedUpdate=reshared_update))
+
+    assert activity.is_shared
+    assert not (activity.is_liked or activity.is_reposted or activity.is_commented)
+    assert activity.shared_caption == "shared caption"
+    assert activity.shared_url == "https://lnkd.in/shared"
+    assert activity.comment_timestamp is None
+
+
+def test_elements_to_linkedin_activity_shared_without_caption():
+    reshared_update = {
+        "commentary": {"text": {"text": None}},
+        "updateMetadata": _share_via("https://lnkd.in/shared"),
+    }
+
+    activity = _activity(_element(resharedUpdate=reshared_update))
+
+    assert not activity.is_shared
+    assert activity.shared_caption == ""
+    assert activity.shared_url == ""
+
+
+def test_elements_to_linkedin_activity_missing_keys():
+    element = {
+        "actor": None,
+        "entityUrn": ENTITY_URN,
+        "commentary": {"text": None},
+        "updateMetadata": {"updateActions": None},
+        "header": {"text": {}},
+    }
+
+    activity = _activity(element)
+
+    assert activity.actor_urn == activity.actor_type == activity.actor_name == ""
+    assert activity.dash_entity_urn == activity.post_urn == ""
+    assert activity.caption == activity.url == activity.comment == ""
+    assert not (
+        activity.is_liked
+        or activity.is_reposted
+        or activity.is_commented
+        or activity.is_shared
+    )
+    assert activity.comment_timestamp is None
+    assert activity.timestamp_ms == ENTITY_TIMESTAMP_MS
+
+
+def test_elements_to_linkedin_activity_malformed_actions():
+    actions = [None, "SHARE_VIA", {"actionType": "SHARE_VIA", "url": "https://u"}]
+    update_metadata = {"urn": ENTITY_URN, "updateActions": {"actions": actions}}
+
+    activity = _activity(_element("Jane likes this", updateMetadata=update_metadata))
+
+    assert activity.url == "https://u"
+
+
+def test_get_urn_from_raw_update():
+    raw_update = "urn:li:fs_updateV2:(urn:li:activity:1,GROUP_FEED,EMPTY,DEFAULT,false)"
+
+    assert get_urn_from_raw_update(raw_update) == "urn:li:activity:1"
+
+
+def test_get_urn_from_raw_update_without_urn():
+    with pytest.raises(ValueError):
+        get_urn_from_raw_update("urn:li:activity:1")
+    with pytest.raises(ValueError):
+        get_update_content(
+            {"commentary": None, "*resharedUpdate": "urn:li:activity:1"}, BASE_URL
+        )
+
+
+def test_parse_list_raw_posts():
+    raw_post = {
+        "actor": {
+            "urn": "urn:li:member:123",
+            "name": {"text": "Jane"},
+            "subDescription": {"text": "2 mo"},
+        },
+        "commentary": {"text": {"text": "content"}},
+        "updateMetadata": {"urn": "urn:li:activity:1"},
+    }
+
+    posts = parse_list_raw_posts([raw_post, {}, {"entityUrn": "x"}], BASE_URL)
+
+    assert posts == [
+        {
+            "author_name": "Jane",
+            "author_profile": f"{BASE_URL}/in/123",
+            "old": "2 mo",
+            "content": "content",
+            "url": f"{BASE_URL}/feed/update/urn:li:activity:1",
+        }
+    ]
+
+
+def test_parse_list_raw_posts_one_post_per_raw_update():
+    l_raw_posts = [
+        {"actor": {"name": {"text": "Jane"}}},
+        {"updateMetadata": {"urn": "urn:li:activity:1"}},
+    ]
+
+    posts = parse_list_raw_posts(l_raw_posts, BASE_URL)
+
+    # fields of consecutive raw updates are not merged into one post
+    assert posts == [
+        {"author_name": "Jane"},
+        {"url": f"{BASE_URL}/feed/update/urn:li:activity:1"},
+    ]